@@ -0,0 +1,10 @@
+#!/usr/bin/env python3
+"""Gemeinsames Einlesen der xtream_config.txt für die Debug-Skripte."""
+
+DEFAULT_PATH = '/Users/mamo/Library/Application Support/MacXtreamer/xtream_config.txt'
+
+
+def load_config(path=DEFAULT_PATH):
+    """Liest die key=value Zeilen der Config in einem Durchgang in ein dict."""
+    with open(path, 'r') as f:
+        return dict(line.strip().split('=', 1) for line in f if '=' in line)
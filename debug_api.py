@@ -1,5 +1,5 @@
 import requests
-import json
+import orjson
 
 # Versuche verschiedene category IDs
 url_template = "http://xcpanel.live:8080/player_api.php?username=xxxxx&password=xxxxx&action=get_vod_streams&category_id=122"
@@ -30,4 +30,4 @@ sample_data = {
 }
 
 print("Beispiel der erwarteten API-Struktur:")
-print(json.dumps(sample_data, indent=2))
+print(orjson.dumps(sample_data, option=orjson.OPT_INDENT_2).decode())
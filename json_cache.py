@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""Lokaler Cache für bereits geparstes JSON der Debug-Skripte, mit ETag/Last-Modified Revalidierung."""
+import hashlib
+import os
+import pickle
+import threading
+import time
+
+import orjson
+import requests
+
+CACHE_DIR = 'xtream_debug_json'
+CACHE_TTL = 3600
+
+# get_json ist der einzige Cache für seine Requests; requests-cache soll sie weder
+# beantworten noch ein zweites Mal (als Rohantwort in der sqlite) speichern
+NO_STORE = {'Cache-Control': 'no-store'}
+
+
+def _cache_file(url, params):
+    # Gehasht, damit die Zugangsdaten aus der Query nicht im Klartext auf der Platte landen
+    full_url = requests.Request('GET', url, params=params).prepare().url
+    h = hashlib.blake2b(full_url.encode(), digest_size=16).hexdigest()
+    return os.path.join(CACHE_DIR, f"{h}.pkl")
+
+
+def _store(path, etag, last_modified, data):
+    # Über eine temporäre Datei schreiben, da get_json auch aus Thread-Pools aufgerufen wird
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp, 'wb') as f:
+        pickle.dump((etag, last_modified, data), f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp, path)
+
+
+def get_json(session, url, params=None, timeout=10, max_age=CACHE_TTL, use_cache=True):
+    """Holt JSON und speichert das geparste Objekt lokal.
+
+    Einträge jünger als max_age werden ohne Request zurückgegeben. Ältere werden per
+    If-None-Match/If-Modified-Since revalidiert; bei 304 entfällt das erneute Parsen.
+    Mit use_cache=False wird der lokale Cache weder gelesen noch geschrieben.
+    """
+    if not use_cache:
+        response = session.get(url, params=params, headers=NO_STORE, timeout=timeout)
+        response.raise_for_status()
+        return orjson.loads(response.content)
+
+    path = _cache_file(url, params)
+    entry = None
+    try:
+        age = time.time() - os.path.getmtime(path)
+        with open(path, 'rb') as f:
+            entry = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError):
+        pass
+
+    headers = dict(NO_STORE)
+    if entry:
+        etag, last_modified, data = entry
+        if age < max_age:
+            return data
+        if etag:
+            headers['If-None-Match'] = etag
+        if last_modified:
+            headers['If-Modified-Since'] = last_modified
+
+    response = session.get(url, params=params, headers=headers, timeout=timeout)
+    if response.status_code == 304 and entry:
+        os.utime(path)
+        return entry[2]
+    response.raise_for_status()
+
+    data = orjson.loads(response.content)
+    _store(path, response.headers.get('ETag'), response.headers.get('Last-Modified'), data)
+    return data
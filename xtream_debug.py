@@ -0,0 +1,340 @@
+#!/usr/bin/env python3
+"""Debug-Werkzeug für die Xtream API.
+
+Fasst die früheren Einzelskripte zusammen, damit Imports, Session, Verbindungspool und
+Caches bei mehreren Prüfungen nur einmal aufgebaut werden:
+
+    python3 xtream_debug.py --mode fields
+    python3 xtream_debug.py --mode all --no-cache
+"""
+import argparse
+import queue
+import re
+import threading
+import traceback
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlencode
+
+import ijson
+import orjson
+import requests
+from requests.adapters import HTTPAdapter
+try:
+    import requests_cache
+except ImportError:
+    requests_cache = None
+
+from config_loader import DEFAULT_PATH, load_config
+from json_cache import CACHE_TTL, get_json
+
+# Erkennt language-bezogene Feldnamen (lang, language, audio, ...)
+LANG_RX = re.compile(r'lang|audio', re.IGNORECASE).search
+
+# ijson-Events, mit denen ein Array-Element beginnt bzw. endet
+ITEM_START_EVENTS = ('start_map', 'start_array', 'string', 'number', 'boolean', 'null')
+ITEM_END_EVENTS = ('end_map', 'end_array', 'string', 'number', 'boolean', 'null')
+
+# Anzahl VOD Items, deren Detail-Info parallel vorab geholt wird
+PREFETCH_COUNT = 5
+
+# Länge der Strukturvorschau der Detail-Info
+PREVIEW_CHARS = 2000
+
+
+def build_session(no_cache=False):
+    """Gemeinsame Session: hält die Verbindung zum Xtream-Server offen (Keep-Alive).
+
+    Sofern requests-cache installiert ist und no_cache nicht gesetzt ist, werden direkte
+    session.get-Aufrufe CACHE_TTL Sekunden lokal zwischengespeichert. get_json (eigener
+    Cache für geparstes JSON) und get_streamed (ijson) umgehen requests-cache.
+    """
+    if requests_cache is not None and not no_cache:
+        # Zugangsdaten weder im Cache-Key noch in der gespeicherten URL ablegen
+        session = requests_cache.CachedSession(
+            'xtream_debug_cache',
+            expire_after=CACHE_TTL,
+            allowable_methods=('GET',),
+            ignored_parameters=('username', 'password'),
+        )
+    else:
+        session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+def get_streamed(session, base, params):
+    """GET mit stream=True, an requests-cache vorbei.
+
+    Beim Speichern puffert requests-cache den kompletten Body, womit das Streaming über
+    ijson keinen Speicher mehr sparen würde. no-store überspringt Lesen und Schreiben im Cache.
+    """
+    return session.get(base, params=params, headers={'Cache-Control': 'no-store'}, timeout=10, stream=True)
+
+
+class _AvailableReader:
+    """Dateiähnliche Hülle: read() liefert schon eingetroffene Daten (read1), statt auf volle Puffer zu warten."""
+
+    def __init__(self, raw):
+        self.read = getattr(raw, 'read1', raw.read)
+
+
+def first_item_and_count(response, stop=None):
+    """Liest das erste Element eines JSON-Arrays und zählt alle Elemente, ohne das Array aufzubauen.
+
+    Wird das optionale threading.Event stop gesetzt, bricht das Lesen ab und die Antwort wird geschlossen.
+    """
+    response.raw.decode_content = True
+    first_item, count, builder = None, 0, None
+    # Ohne read1 würde ijson erst nach vollen 64 KiB Events liefern und stop zu spät sehen
+    for prefix, event, value in ijson.parse(_AvailableReader(response.raw), use_float=True):
+        if stop is not None and stop.is_set():
+            response.close()
+            break
+        if prefix == 'item' and event in ITEM_START_EVENTS:
+            count += 1
+            if count == 1:
+                builder = ijson.ObjectBuilder()
+        if builder is not None:
+            builder.event(event, value)
+            if prefix == 'item' and event in ITEM_END_EVENTS:
+                first_item, builder = builder.value, None
+    return first_item, count
+
+
+def find_lang_fields(obj):
+    """Sucht language-bezogene Felder iterativ (Stack statt Rekursion), in Dokumentreihenfolge."""
+    results = []
+    stack = deque([(obj, "", False)])
+    while stack:
+        node, path, is_lang = stack.pop()
+        if is_lang:
+            results.append((path, node))
+        # Kinder rückwärts auf den Stack, damit die Reihenfolge der Rekursion erhalten bleibt
+        if isinstance(node, dict):
+            for key, value in reversed(node.items()):
+                current_path = f"{path}.{key}" if path else key
+                stack.append((value, current_path, bool(LANG_RX(key))))
+        elif isinstance(node, list):
+            for i in range(len(node) - 1, -1, -1):
+                stack.append((node[i], f"{path}[{i}]", False))
+    return results
+
+
+def first_category_id(cats):
+    """ID der ersten Kategorie, mit Fallback auf 'id' bzw. '1'."""
+    row = cats[0]
+    try:
+        return row['category_id']
+    except KeyError:
+        return row.get('id', '1')
+
+
+def check_fields(session, base, auth, use_cache):
+    """Alle Felder des ersten VOD Items der ersten Kategorie ausgeben."""
+    # Erst Kategorien holen
+    print("Fetching VOD categories...")
+    cats = get_json(session, base, {**auth, 'action': 'get_vod_categories'}, use_cache=use_cache)
+    if not cats:
+        return
+    cat_id = first_category_id(cats)
+    print(f"Using category: {cats[0].get('category_name', 'Unknown')} (ID: {cat_id})")
+
+    # Jetzt Items aus dieser Kategorie holen
+    params = {**auth, 'action': 'get_vod_streams', 'category_id': cat_id}
+    response = get_streamed(session, base, params)
+    if response.status_code != 200:
+        return
+    first_item, count = first_item_and_count(response)
+    if not first_item:
+        print("No items in this category")
+        return
+
+    print(f"\n✅ Found {count} items")
+    print("\nAll fields in first item:")
+    # Alle Felder ausgeben und dabei language-bezogene Felder merken
+    lang_hits = []
+    for key in first_item:
+        value = first_item[key]
+        if isinstance(value, str) and len(value) > 100:
+            print(f"  {key}: <string, {len(value)} chars>")
+        else:
+            print(f"  {key}: {value}")
+        if LANG_RX(key):
+            lang_hits.append((key, value))
+
+    if lang_hits:
+        print(f"\n🎯 Language-related fields: {[key for key, _ in lang_hits]}")
+        for key, value in lang_hits:
+            print(f"  {key} = {value}")
+    else:
+        print("\n❌ No language-related fields found")
+
+
+def check_languages(session, base, auth, use_cache):
+    """Live- und VOD-Streams parallel abfragen und das erste Ergebnis mit Daten auswerten."""
+    # Teste verschiedene Endpunkte
+    endpoints = [
+        ('get_live_streams', '1'),
+        ('get_vod_streams', '1'),
+    ]
+
+    stop = threading.Event()
+    results = queue.Queue()
+
+    def probe(action, cat_id):
+        try:
+            response = get_streamed(session, base, {**auth, 'action': action, 'category_id': cat_id})
+            if stop.is_set():
+                response.close()
+            elif response.status_code != 200:
+                results.put((action, response.status_code, None, 0, None))
+            else:
+                results.put((action, response.status_code, *first_item_and_count(response, stop), None))
+        except Exception as e:
+            results.put((action, None, None, 0, e))
+
+    # Alle Endpunkte parallel anfragen und beim ersten Endpunkt mit Daten aufhören.
+    # Daemon-Threads, damit ein noch auf den Server wartender Probe das Programmende nicht aufhält.
+    for action, cat_id in endpoints:
+        threading.Thread(target=probe, args=(action, cat_id), daemon=True).start()
+    try:
+        for _ in endpoints:
+            action, status, first_item, count, error = results.get()
+            print(f"\n{'='*60}")
+            print(f"Testing: {action}")
+            print(f"{'='*60}")
+
+            if error is not None:
+                print(f"Error: {error}")
+                continue
+            if status != 200:
+                print(f"Error: {status}")
+                continue
+            if not first_item:
+                print("No items returned")
+                continue
+
+            print(f"Found {count} items")
+            print("\nFirst item fields:")
+            for key in first_item:
+                value = first_item[key]
+                if isinstance(value, str) and len(value) > 100:
+                    print(f"  {key}: <string, {len(value)} chars>")
+                else:
+                    print(f"  {key}: {value}")
+
+            # Suche nach language-bezogenen Feldern
+            lang_fields = [k for k in first_item if LANG_RX(k)]
+            if lang_fields:
+                print(f"\n🎯 Language-related fields found: {lang_fields}")
+            break
+    finally:
+        # Übrige Probes brechen beim nächsten ijson-Event ab und schließen ihre Antwort
+        stop.set()
+
+
+def check_vod(session, base, auth, use_cache):
+    """Detail-Info der ersten VOD Items nach language-bezogenen Feldern durchsuchen."""
+    # Hole ein VOD Item
+    print("Fetching VOD categories...")
+    cats = get_json(session, base, {**auth, 'action': 'get_vod_categories'}, use_cache=use_cache)
+    cat_id = first_category_id(cats)
+
+    # Hole Items
+    data = get_json(session, base, {**auth, 'action': 'get_vod_streams', 'category_id': cat_id}, use_cache=use_cache)
+    if not data:
+        return
+
+    print(f"Checking detailed info for VOD ID: {data[0].get('stream_id')}")
+    print(f"VOD Name: {data[0].get('name')}")
+
+    # Hole Detail-Info für die ersten Items parallel
+    def fetch_vod_info(item):
+        return get_json(session, base, {**auth, 'action': 'get_vod_info', 'vod_id': item.get('stream_id')}, use_cache=use_cache)
+
+    with ThreadPoolExecutor(max_workers=4) as ex:
+        futures = [ex.submit(fetch_vod_info, item) for item in data[:PREFETCH_COUNT]]
+
+    try:
+        detail = futures[0].result()
+    except (requests.RequestException, ValueError) as e:
+        print(f"\n❌ Detail info not available: {e}")
+    else:
+        print("\n📋 VOD Detail Info Structure:")
+        print(orjson.dumps(detail, option=orjson.OPT_INDENT_2).decode()[:PREVIEW_CHARS])
+
+        lang_fields = find_lang_fields(detail)
+        if lang_fields:
+            print("\n🎯 Language-related fields found:")
+            for path, value in lang_fields:
+                print(f"  {path} = {value}")
+        else:
+            print("\n❌ No language-related fields in detailed info")
+
+    # Übrige vorab geholte Items nur kurz zusammenfassen
+    for item, future in zip(data[1:], futures[1:]):
+        try:
+            lang_fields = find_lang_fields(future.result())
+        except (requests.RequestException, ValueError) as e:
+            print(f"\n{item.get('name')}: Error {e}")
+            continue
+        print(f"\n{item.get('name')} (ID: {item.get('stream_id')}): {len(lang_fields)} language-related fields")
+        for path, value in lang_fields:
+            print(f"  {path} = {value}")
+
+
+def test_series(session, base, auth, use_cache):
+    """Erstes Item von get_series mit category_id=135 ausgeben."""
+    params = {'action': 'get_series', 'category_id': 135}
+
+    print("Making API call to:", f"{base}?{urlencode(params)}")
+
+    data = get_json(session, base, {**auth, **params}, use_cache=use_cache)
+    print("\nFirst item from API response:")
+    print(orjson.dumps(data[0] if data else {}, option=orjson.OPT_INDENT_2).decode())
+
+
+MODES = {
+    'fields': check_fields,
+    'languages': check_languages,
+    'vod': check_vod,
+    'series': test_series,
+}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Debug-Abfragen gegen die Xtream API")
+    parser.add_argument('--mode', choices=[*MODES, 'all'], default='all', help="auszuführende Prüfung (Standard: all)")
+    parser.add_argument('--no-cache', action='store_true', help="lokale Caches (requests-cache, JSON-Cache) weder lesen noch schreiben")
+    parser.add_argument('--config', default=DEFAULT_PATH, help="Pfad zur xtream_config.txt")
+    args = parser.parse_args(argv)
+
+    try:
+        cfg = load_config(args.config)
+        base = f"{cfg['address']}/player_api.php"
+        auth = {'username': cfg['username'], 'password': cfg['password']}
+    except Exception as e:
+        print(f"Config error: {e}")
+        return 1
+
+    session = build_session(args.no_cache)
+    modes = list(MODES) if args.mode == 'all' else [args.mode]
+
+    failed = False
+    for name in modes:
+        if len(modes) > 1:
+            print(f"\n{'#'*60}\n# {name}\n{'#'*60}")
+        try:
+            MODES[name](session, base, auth, not args.no_cache)
+        except Exception as e:
+            failed = True
+            print(f"Error: {e}")
+            traceback.print_exc()
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())